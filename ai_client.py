@@ -6,6 +6,8 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from langchain_community.retrievers import TavilySearchAPIRetriever
 from langchain.chains import RetrievalQA
+from summarizer import get_groq_llm
+from llm_router import LLMRouter, Provider
 
 import dotenv
 dotenv.load_dotenv()
@@ -42,6 +44,19 @@ def get_gemini_llm():
         logger.error(f"Failed to initialize Gemini LLM: {e}")
         return None
 
+def get_llm_router():
+    """Gemini first, Groq as the hedge/fallback; the router reorders them from live stats."""
+    providers = []
+    gemini = get_gemini_llm()
+    if gemini:
+        providers.append(Provider("gemini", gemini))
+    try:
+        providers.append(Provider("groq", get_groq_llm(temperature=0.7)))
+        logger.info("Groq LLM initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize Groq LLM: {e}")
+    return LLMRouter(providers)
+
 def build_prompt(question: str) -> str:
     return prompt_template.format(question=question)
 
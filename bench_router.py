@@ -0,0 +1,107 @@
+"""Synthetic chat firehose benchmark for MessageRouter.
+
+Run with `python bench_router.py`. Compares the routing fast path against
+the old behaviour of awaiting `process_commands` for every message and
+stripping each mention with repeated str.replace calls. The command
+dispatch is modelled as a coroutine that resolves the prefix and splits
+the invoked command, which is the floor of what discord.py does per call.
+"""
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+from router import MessageRouter, ROUTE_COMMAND, ROUTE_MENTION, strip_mentions
+
+BOT_ID = 111111111111111111
+EVENTS = 200_000
+
+
+def make_firehose(count, rng):
+    guild = SimpleNamespace(id=1)
+    channels = [SimpleNamespace(id=c) for c in range(100, 120)]
+    users = [SimpleNamespace(id=10_000 + u) for u in range(200)]
+    bot_user = SimpleNamespace(id=BOT_ID)
+    words = "the quick brown fox jumps over the lazy dog lol gg ok".split()
+    messages = []
+    for _ in range(count):
+        mentions = rng.sample(users, rng.choice((0, 0, 0, 1, 2)))
+        roll = rng.random()
+        if roll < 0.01:
+            mentions.append(bot_user)
+        text = " ".join(rng.choices(words, k=rng.randint(3, 25)))
+        text = " ".join([f"<@{m.id}>" for m in mentions] + [text])
+        if 0.01 <= roll < 0.02:
+            text = "!status"
+        messages.append(SimpleNamespace(
+            author=rng.choice(users),
+            guild=guild,
+            channel=rng.choice(channels),
+            content=text,
+            mentions=mentions,
+            reference=None,
+        ))
+    return messages
+
+
+async def get_prefix(message):
+    return '!'
+
+
+async def process_commands(message):
+    if message.author.id == BOT_ID:
+        return
+    prefix = await get_prefix(message)
+    if message.content.startswith(prefix):
+        message.content[len(prefix):].split(maxsplit=1)
+
+
+async def old_path(messages):
+    handled = 0
+    for message in messages:
+        if message.author.id == BOT_ID:
+            continue
+        if any(m.id == BOT_ID for m in message.mentions):
+            content = message.content
+            for mention in message.mentions:
+                content = content.replace(f'<@{mention.id}>', '').strip()
+                content = content.replace(f'<@!{mention.id}>', '').strip()
+            handled += 1
+        await process_commands(message)
+    return handled
+
+
+async def new_path(router, messages):
+    handled = 0
+    for message in messages:
+        route = router.route(message)
+        if not route:
+            continue
+        if route & ROUTE_MENTION:
+            strip_mentions(message.content)
+            handled += 1
+        if route & ROUTE_COMMAND:
+            await process_commands(message)
+    return handled
+
+
+def bench(label, fn, *args):
+    start = time.perf_counter()
+    asyncio.run(fn(*args))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {EVENTS / elapsed:>12,.0f} events/sec")
+
+
+def main():
+    rng = random.Random(42)
+    messages = make_firehose(EVENTS, rng)
+    router = MessageRouter(prefix='!')
+    router.set_bot_user(BOT_ID)
+    bench("old on_message path", old_path, messages)
+    bench("router fast path", new_path, router, messages)
+    router.allowlist = {1: frozenset({100, 101})}
+    bench("router + channel allowlist", new_path, router, messages)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+from time import perf_counter
+# Taken before the heavy imports below so the logged startup time covers a full restart
+STARTED_AT = perf_counter()
+
 import os
 import logging
 import asyncio
@@ -23,6 +27,7 @@ async def main():
     if not os.environ.get("GEMINI_API_KEY"):
         logger.error("GEMINI_API_KEY environment variable not set")
         return
+    bot.started_at = STARTED_AT
     try:
         await bot.start(discord_token)
     except Exception as e:
@@ -0,0 +1,144 @@
+"""Exactly-once checks for the scheduler lease and reminder claims.
+
+Run with `python check_leader.py`. Covers a stale fencing token claiming
+nothing, and two replicas (separate processes, each running a LeaderElector
+and a claim loop against one DB file) delivering every reminder exactly once
+while the first leader is frozen with SIGSTOP and resumed after its lease
+has been taken over. Reminders are timed on a sped-up clock so the whole run
+takes about ten seconds.
+"""
+import asyncio
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import reminder_db
+from leader import LeaderElector, init_lease_db
+from recurrence import TIME_FORMAT
+from reminder_db import add_reminder, claim_due_reminders, get_all_reminders, init_db
+
+ONE_SHOTS = 60
+SIM_MINUTES_PER_SECOND = 10
+RUN_SECONDS = 9.0
+FREEZE_SECONDS = 3.0
+TTL = 1.0
+HEARTBEAT = 0.2
+
+
+def sim_now(base: datetime, started: float) -> datetime:
+    return base + timedelta(minutes=(time.time() - started) * SIM_MINUTES_PER_SECOND)
+
+
+async def seed(db_path: str, base: datetime):
+    reminder_db.DB_PATH = db_path
+    await init_db()
+    await init_lease_db(db_path)
+    for i in range(ONE_SHOTS):
+        when = base + timedelta(minutes=i + 1)
+        await add_reminder(1, 1, f"one-shot {i}", when.strftime(TIME_FORMAT))
+    await add_reminder(1, 1, "every minute", (base + timedelta(minutes=1)).strftime(TIME_FORMAT),
+                       recurrence="* * * * *", tz="UTC")
+
+
+async def check_stale_token_claims_nothing():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "reminders.db")
+        base = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        await seed(db_path, base)
+        old = LeaderElector(ttl=TTL, heartbeat=HEARTBEAT, db_path=db_path)
+        assert await old.try_acquire()
+        stale_token = old.token
+        # Let the lease lapse and hand it to another replica, which bumps the token
+        await asyncio.sleep(TTL + 0.1)
+        new = LeaderElector(ttl=TTL, heartbeat=HEARTBEAT, db_path=db_path)
+        assert await new.try_acquire() and new.token == stale_token + 1
+
+        later = base + timedelta(minutes=10)
+        assert await claim_due_reminders(later, old.name, old.holder, stale_token) == []
+        assert len(await get_all_reminders()) == ONE_SHOTS + 1, "a stale claim must not settle anything"
+
+        due = await claim_due_reminders(later, new.name, new.holder, new.token)
+        assert len(due) == 11, len(due)
+        # Settled in the claim itself: claiming again returns nothing
+        assert await claim_due_reminders(later, new.name, new.holder, new.token) == []
+        assert len(await get_all_reminders()) == ONE_SHOTS - 10 + 1
+
+
+async def worker(db_path: str, out_path: str, base: datetime, started: float):
+    """One replica: hold the lease when possible and record every reminder it claims."""
+    reminder_db.DB_PATH = db_path
+    elector = LeaderElector(ttl=TTL, heartbeat=HEARTBEAT, db_path=db_path)
+    asyncio.create_task(elector.run())
+    while True:
+        await elector.wait_for_leadership()
+        try:
+            due = await claim_due_reminders(sim_now(base, started), elector.name, elector.holder, elector.token)
+        except sqlite3.OperationalError:
+            await asyncio.sleep(HEARTBEAT / 4)
+            continue
+        with open(out_path, "a") as f:
+            for row in due:
+                f.write(f"{os.getpid()} {row[0]} {row[4].replace(' ', 'T')}\n")
+        await asyncio.sleep(HEARTBEAT / 4)
+
+
+def current_holder_pid(db_path: str) -> int:
+    with sqlite3.connect(db_path) as db:
+        row = db.execute("SELECT holder, expires_at FROM leases WHERE name = 'scheduler'").fetchone()
+    assert row and row[1] > time.time(), "nobody holds the lease"
+    return int(row[0].split(":")[1])
+
+
+def check_two_replicas_deliver_exactly_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "reminders.db")
+        out_path = os.path.join(tmp, "delivered.txt")
+        base = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        asyncio.run(seed(db_path, base))
+        started = time.time()
+        args = [sys.executable, __file__, "--worker", db_path, out_path, base.isoformat(), repr(started)]
+        procs = [subprocess.Popen(args) for _ in range(2)]
+        try:
+            time.sleep(1.5)
+            frozen = current_holder_pid(db_path)
+            os.kill(frozen, signal.SIGSTOP)
+            time.sleep(FREEZE_SECONDS)
+            os.kill(frozen, signal.SIGCONT)
+            time.sleep(max(0.0, started + RUN_SECONDS - time.time()))
+        finally:
+            for proc in procs:
+                proc.kill()
+                proc.wait()
+
+        with open(out_path) as f:
+            deliveries = [line.split() for line in f]
+        ids = Counter(int(reminder_id) for _, reminder_id, _ in deliveries)
+        one_shot_ids = set(range(1, ONE_SHOTS + 1))
+        recurring_id = ONE_SHOTS + 1
+        for reminder_id in one_shot_ids:
+            assert ids[reminder_id] == 1, f"reminder {reminder_id} delivered {ids[reminder_id]} times"
+        occurrences = Counter(when for _, reminder_id, when in deliveries if int(reminder_id) == recurring_id)
+        assert occurrences and max(occurrences.values()) == 1, occurrences
+        senders = {int(pid) for pid, _, _ in deliveries}
+        assert len(senders) == 2, "the lease should have failed over while the first leader was frozen"
+
+
+def main():
+    asyncio.run(check_stale_token_claims_nothing())
+    print("ok  check_stale_token_claims_nothing")
+    check_two_replicas_deliver_exactly_once()
+    print("ok  check_two_replicas_deliver_exactly_once")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 6 and sys.argv[1] == "--worker":
+        _, _, db, out, base_iso, start = sys.argv
+        asyncio.run(worker(db, out, datetime.fromisoformat(base_iso), float(start)))
+    else:
+        main()
@@ -0,0 +1,151 @@
+"""Stub-provider checks for LLMRouter.
+
+Run with `python check_llm_router.py`. Covers hedging after the deadline,
+fallback on error, ranking stability after a hedge, recording the real outcome
+of abandoned blocking calls, cancelling async providers, and the circuit
+breaker opening and then going half-open. Deadlines and cooldowns are shrunk so the
+whole run takes a couple of seconds.
+"""
+import asyncio
+import time
+
+import llm_router
+from llm_router import LLMRouter, Provider
+
+
+class StubLLM:
+    def __init__(self, delay, fail=False, text="ok"):
+        self.delay = delay
+        self.fail = fail
+        self.text = text
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("stub failure")
+        return self.text
+
+
+async def check_hedge_after_deadline():
+    slow = Provider("slow", StubLLM(1.0, text="slow"))
+    fast = Provider("fast", StubLLM(0.05, text="fast"))
+    router = LLMRouter([slow, fast])
+    start = time.perf_counter()
+    assert await router.invoke("q") == "fast"
+    elapsed = time.perf_counter() - start
+    assert elapsed < llm_router.DEFAULT_DEADLINE + 0.5, elapsed
+    assert fast.hedged == 1
+    assert [p.name for p in router.ranked()] == ["fast", "slow"]
+
+
+async def check_abandoned_call_is_recorded():
+    # A blocking hedge loser can't be interrupted; its real latency must still land in the stats
+    slow = Provider("slow", StubLLM(0.5, text="slow"))
+    fast = Provider("fast", StubLLM(0.01, text="fast"))
+    router = LLMRouter([slow, fast])
+    assert await router.invoke("q") == "fast"
+    assert not slow.latencies
+    await asyncio.sleep(0.6)
+    assert len(slow.latencies) == 1 and slow.latencies[0] >= 0.5, list(slow.latencies)
+
+
+class AsyncStubLLM:
+    def __init__(self, delay, text="ok"):
+        self.delay = delay
+        self.text = text
+        self.cancelled = 0
+
+    def invoke(self, prompt):
+        raise AssertionError("async providers must not be run on a thread")
+
+    async def ainvoke(self, prompt):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self.text
+
+
+async def check_async_provider_is_cancelled():
+    slow_llm = AsyncStubLLM(1.0, text="slow")
+    slow = Provider("slow", slow_llm)
+    fast = Provider("fast", AsyncStubLLM(0.01, text="fast"))
+    router = LLMRouter([slow, fast])
+    assert await router.invoke("q") == "fast"
+    await asyncio.sleep(0)
+    assert slow_llm.cancelled == 1, "losing async request should be aborted"
+    assert not slow.latencies
+
+
+async def check_hedge_does_not_flip_ranking():
+    # A backup cancelled shortly after starting must not look fast
+    # History says 0.12s, so the hedge fires at 0.12s and the backup is cancelled ~20ms in
+    primary = Provider("primary", StubLLM(0.14, text="primary"))
+    backup = Provider("backup", StubLLM(1.0, text="backup"))
+    for _ in range(llm_router.MIN_SAMPLES):
+        primary.record_success(0.12)
+    router = LLMRouter([primary, backup])
+    # Keep the no-samples prior (DEFAULT_DEADLINE / 2) above the primary's 0.12s
+    previous_default = llm_router.DEFAULT_DEADLINE
+    llm_router.DEFAULT_DEADLINE = 1.0
+    try:
+        for _ in range(3):
+            assert await router.invoke("q") == "primary"
+            assert [p.name for p in router.ranked()] == ["primary", "backup"]
+        assert backup.hedged >= 1
+    finally:
+        llm_router.DEFAULT_DEADLINE = previous_default
+    p50 = backup.percentile(0.5)
+    assert p50 is None or p50 >= 0.12, p50
+
+
+async def check_fallback_on_error():
+    broken = Provider("broken", StubLLM(0.0, fail=True))
+    good = Provider("good", StubLLM(0.05, text="good"))
+    router = LLMRouter([broken, good])
+    start = time.perf_counter()
+    assert await router.invoke("q") == "good"
+    # Fallback is immediate, not after the hedge deadline
+    assert time.perf_counter() - start < llm_router.DEFAULT_DEADLINE
+    assert good.hedged == 0
+
+
+async def check_circuit_breaker():
+    flaky = StubLLM(0.0, fail=True)
+    provider = Provider("flaky", flaky)
+    router = LLMRouter([provider])
+    for _ in range(llm_router.FAILURE_THRESHOLD):
+        assert await router.invoke("q") is None
+    assert provider.stats()["circuit_open"]
+    calls = flaky.calls
+    assert await router.invoke("q") is None
+    assert flaky.calls == calls, "open circuit must not call the provider"
+
+    await asyncio.sleep(llm_router.COOLDOWN_SECONDS + 0.05)
+    assert not provider.stats()["circuit_open"], "breaker should be half-open after the cooldown"
+    # A single failure while half-open reopens it
+    assert await router.invoke("q") is None
+    assert provider.stats()["circuit_open"]
+
+    await asyncio.sleep(llm_router.COOLDOWN_SECONDS + 0.05)
+    flaky.fail = False
+    assert await router.invoke("q") == "ok"
+    assert provider.consecutive_failures == 0 and not provider.stats()["circuit_open"]
+
+
+async def main():
+    llm_router.DEFAULT_DEADLINE = 0.2
+    llm_router.MIN_DEADLINE = 0.05
+    llm_router.COOLDOWN_SECONDS = 0.2
+    for check in (check_hedge_after_deadline, check_abandoned_call_is_recorded,
+                  check_async_provider_is_cancelled, check_hedge_does_not_flip_ranking,
+                  check_fallback_on_error, check_circuit_breaker):
+        await check()
+        print(f"ok  {check.__name__}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+import io
+import importlib
+import logging
+import sys
+import discord
+from time import perf_counter
+from discord.ext import commands
+from bor3y import EXTENSIONS
+from diagnostics import is_profiling, profile_loop, format_report
+
+MAX_PROFILE_SECONDS = 120
+
+# Stateless helpers the cogs import from, reloaded (in dependency order) before the cogs so
+# the cogs pick up the new code. Anything holding live state stays as-is and needs a restart:
+# bor3y (bot class, reminder/digest loops), router, llm_router, leader, pdf_index, diagnostics.
+HOT_RELOAD_MODULES = ("recurrence", "reminder_db", "task_db", "summarizer", "ai_client")
+RESTART_ONLY_MODULES = ("bor3y", "router", "llm_router", "leader", "pdf_index", "diagnostics")
+
+logger = logging.getLogger(__name__)
+
+
+class Admin(commands.Cog):
+    """Owner-only maintenance commands."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name='reload')
+    @commands.is_owner()
+    async def reload_command(self, ctx, extension: str = None, sync: bool = False):
+        """Reload helper modules and one extension (or all of them) in place.
+
+        Pass sync=true if slash command signatures changed. Only the cogs and
+        HOT_RELOAD_MODULES are reloaded; changes to RESTART_ONLY_MODULES (including the
+        reminder/digest loops in bor3y.py) still need a full restart.
+        """
+        if extension is None:
+            targets = EXTENSIONS
+        else:
+            target = extension if extension.startswith("cogs.") else f"cogs.{extension}"
+            if target not in EXTENSIONS:
+                await ctx.send(f"❌ Unknown extension `{extension}`.")
+                return
+            targets = (target,)
+
+        start = perf_counter()
+        target = None
+        try:
+            for name in HOT_RELOAD_MODULES:
+                if name in sys.modules:
+                    target = name
+                    importlib.reload(sys.modules[name])
+            for target in targets:
+                await self.bot.reload_extension(target)
+            if sync:
+                await self.bot.tree.sync()
+        except Exception as e:
+            logger.error(f"Error reloading {target}: {e}")
+            await ctx.send(f"⚠️ Failed to reload `{target}`: {e}")
+            return
+        elapsed = perf_counter() - start
+
+        logger.info(f"Reloaded {len(HOT_RELOAD_MODULES)} helper module(s) and {len(targets)} extension(s) in {elapsed * 1000:.0f}ms")
+        message = f"🔄 Reloaded {len(targets)} extension(s) and helper modules in **{elapsed * 1000:.0f}ms**"
+        if self.bot.ready_after is not None:
+            message += f" (a full restart took {self.bot.ready_after:.2f}s)"
+        message += (
+            ".\nChanges to " + ", ".join(f"`{name}`" for name in RESTART_ONLY_MODULES)
+            + " (including the reminder and digest loops) still need a full restart."
+        )
+        await ctx.send(message)
+
+    @reload_command.error
+    async def reload_error(self, ctx, error):
+        if isinstance(error, commands.NotOwner):
+            await ctx.send("❌ Only the bot owner can reload commands.")
+
+    @commands.command(name='profile')
+    @commands.is_owner()
+    async def profile_command(self, ctx, seconds: float = 10, threshold_ms: float = 100, top: int = 15):
+        """Sample the event loop thread and log slow callbacks for a while, then upload the results"""
+        if is_profiling():
+            await ctx.send("⏳ A profile is already running; try again when it finishes.")
+            return
+        seconds = max(1, min(seconds, MAX_PROFILE_SECONDS))
+        threshold = threshold_ms / 1000
+        await ctx.send(f"🩺 Profiling for {seconds:.0f}s (slow callback threshold {threshold_ms:.0f}ms)...")
+        try:
+            profiler, collector = await profile_loop(seconds, threshold)
+        except Exception as e:
+            logger.error(f"Error while profiling: {e}")
+            await ctx.send(f"⚠️ Profiling failed: {e}")
+            return
+
+        report = format_report(profiler, collector, seconds, threshold, top)
+        lag = self.bot.lag_monitor
+        report += (
+            f"\n\nLoop lag: last {lag.last_lag * 1000:.0f}ms, max {lag.max_lag * 1000:.0f}ms, "
+            f"{lag.lag_events} event(s) over {lag.threshold * 1000:.0f}ms"
+        )
+        files = [
+            discord.File(io.BytesIO(report.encode("utf-8")), filename="profile_report.txt"),
+            # Collapsed stacks: feed to flamegraph.pl or drop into speedscope.app
+            discord.File(io.BytesIO(profiler.folded().encode("utf-8")), filename="profile.folded"),
+        ]
+        summary = f"📊 {profiler.samples} samples, {len(collector.callbacks)} slow callback(s) over {threshold_ms:.0f}ms."
+        await ctx.send(summary, files=files)
+
+    @profile_command.error
+    async def profile_error(self, ctx, error):
+        if isinstance(error, commands.NotOwner):
+            await ctx.send("❌ Only the bot owner can run the profiler.")
+
+
+async def setup(bot):
+    await bot.add_cog(Admin(bot))
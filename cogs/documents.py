@@ -0,0 +1,131 @@
+import logging
+import asyncio
+import os
+import discord
+from discord import app_commands
+from discord.ext import commands
+from ai_client import get_search_chain
+from summarizer import load_pdf, run_summarizer
+from pdf_index import hash_file, index_document, answer_question, document_id, resolve_document, set_channel_document, get_channel_document
+
+logger = logging.getLogger(__name__)
+
+
+class Documents(commands.Cog):
+    """Web search, PDF summaries and follow-up questions."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="search", description="Search the web and answer using Gemini")
+    @app_commands.describe(query="Your search query")
+    async def search_command(self, interaction: discord.Interaction, query: str):
+        try:
+            await interaction.response.defer(thinking=True)
+            qa_chain = get_search_chain()
+            loop = asyncio.get_event_loop()
+            response = await loop.run_in_executor(None, lambda: qa_chain.invoke(query))
+            answer = response['result']
+            sources = response.get('source_documents', [])
+            sources_text = "\n".join([f"[{doc.metadata.get('title','Source')}]({doc.metadata.get('source','')})" for doc in sources])
+            truncated_sources = sources_text
+            if len(truncated_sources) > 1024:
+                truncated_sources = truncated_sources[:1020] + "..."
+
+            embed = discord.Embed(
+                title="Search Results",
+                description=answer,
+                color=0x0099ff
+            )
+            if truncated_sources:
+                embed.add_field(name="Sources", value=truncated_sources, inline=False)
+            else:
+                embed.add_field(name="Sources", value="No sources found.", inline=False)
+            await interaction.followup.send(embed=embed)
+
+            if len(sources_text) > 1024:
+                chunks = [sources_text[i:i+2000] for i in range(0, len(sources_text), 2000)]
+                for chunk in chunks:
+                    await interaction.followup.send(chunk)
+        except Exception as e:
+            logger.error(f"Error in search command: {e}")
+            await interaction.followup.send("Sorry, I couldn't perform the search. Please try again later.")
+
+    @app_commands.command(name="summarize", description="Upload a PDF and get a summary")
+    @app_commands.describe(file="Attach your PDF")
+    async def summarize_command(self, interaction: discord.Interaction, file: discord.Attachment):
+        await interaction.response.defer(thinking=True)  # show "thinking" status
+
+        if not file.filename.endswith(".pdf"):
+            await interaction.followup.send("❌ Please upload a PDF file.")
+            return
+
+        # Save the file locally
+        file_path = f"./{file.filename}"
+        await file.save(file_path)
+
+        try:
+            # Run blocking summarizer in thread pool
+            loop = asyncio.get_event_loop()
+            doc_hash = await loop.run_in_executor(None, lambda: hash_file(file_path))
+            docs = await loop.run_in_executor(None, lambda: load_pdf(file_path))
+            summary = await loop.run_in_executor(None, lambda: run_summarizer(file_path, docs))
+
+            if len(summary) > 2000:  # Discord message limit
+                with open("summary.txt", "w", encoding="utf-8") as f:
+                    f.write(summary)
+                await interaction.followup.send("📄 Summary is too long, here's a file:", file=discord.File("summary.txt"))
+            else:
+                await interaction.followup.send(f"📑 **Summary:**\n{summary}")
+
+            # Keep the chunks around so follow-up questions don't need a re-upload
+            try:
+                await loop.run_in_executor(None, lambda: index_document(doc_hash, docs, file.filename))
+                set_channel_document(interaction.guild_id, interaction.channel_id, doc_hash)
+                await interaction.followup.send(
+                    f"🔎 Ask follow-up questions with `/ask_pdf` (document `{document_id(doc_hash)}`)."
+                )
+            except Exception as e:
+                logger.error(f"Error indexing PDF {file.filename}: {e}")
+        except Exception as e:
+            await interaction.followup.send(f"⚠️ Error summarizing: {e}")
+        finally:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    @app_commands.command(name="ask_pdf", description="Ask a question about a previously summarized PDF")
+    @app_commands.describe(
+        question="Your question about the document",
+        document="Document ID from /summarize (defaults to the last PDF summarized in this channel)"
+    )
+    async def ask_pdf_command(self, interaction: discord.Interaction, question: str, document: str = None):
+        await interaction.response.defer(thinking=True)
+        try:
+            if document is not None:
+                doc_hash = resolve_document(document, interaction.guild_id, interaction.channel_id)
+                if not doc_hash:
+                    await interaction.followup.send(
+                        "❌ Unknown document ID. Use the 12-character ID `/summarize` showed in this server."
+                    )
+                    return
+            else:
+                doc_hash = get_channel_document(interaction.channel_id)
+            if not doc_hash:
+                await interaction.followup.send("❌ No summarized PDF found. Use `/summarize` first.")
+                return
+
+            loop = asyncio.get_event_loop()
+            answer = await loop.run_in_executor(None, lambda: answer_question(doc_hash, question))
+
+            if len(answer) > 2000:
+                chunks = [answer[i:i+2000] for i in range(0, len(answer), 2000)]
+                for chunk in chunks:
+                    await interaction.followup.send(chunk)
+            else:
+                await interaction.followup.send(f"📄 **Answer:**\n{answer}")
+        except Exception as e:
+            logger.error(f"Error in ask_pdf command: {e}")
+            await interaction.followup.send("⚠️ Sorry, I couldn't answer from that document.")
+
+async def setup(bot):
+    await bot.add_cog(Documents(bot))
@@ -0,0 +1,70 @@
+import discord
+from discord.ext import commands
+from bor3y import llm_router
+
+
+class General(commands.Cog):
+    """Help and status commands."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name='help')
+    async def help_command(self, ctx):
+        embed = discord.Embed(
+            title="🤖 برعي - بواب السيرفر",
+            description="أنا برعي، بواب السيرفر! مساعد ذكي يمكنه الإجابة على أسئلتكم\nI'm Borai, the Server Gatekeeper! An AI assistant that can answer your questions",
+            color=0x00ff00
+        )
+        embed.add_field(
+            name="كيفية الاستخدام / How to use:",
+            value="اذكرني (@برعي) متبوعاً بسؤالك!\nSimply mention me (@Borai) followed by your question!",
+            inline=False
+        )
+        embed.add_field(
+            name="مثال / Example:",
+            value="@برعي ما هي عاصمة فرنسا؟\n@Borai What is the capital of France?",
+            inline=False
+        )
+        embed.add_field(
+            name="المميزات / Features:",
+            value="• إجابات ذكية باستخدام Google Gemini / AI-powered responses\n• محادثة طبيعية / Natural conversation\n• إجابات مفيدة ومعلوماتية / Helpful and informative answers\n• يدعم العربية والإنجليزية / Supports Arabic and English\n• تذكيرات يومية للمهام / Daily task reminders at 12 PM Cairo time",
+            inline=False
+        )
+        await ctx.send(embed=embed)
+
+    @commands.command(name='status')
+    async def status_command(self, ctx):
+        embed = discord.Embed(
+            title="🔧 Bot Status",
+            color=0x0099ff
+        )
+        embed.add_field(name="Discord", value="✅ Connected", inline=True)
+        for provider in llm_router.providers:
+            stats = provider.stats()
+            if stats["circuit_open"]:
+                value = "⛔ Circuit open"
+            elif stats["p95"] is None:
+                value = "✅ Connected"
+            else:
+                value = f"✅ p50 {stats['p50'] * 1000:.0f}ms / p95 {stats['p95'] * 1000:.0f}ms"
+            value += f"\n{stats['requests']} calls, {stats['hedged']} hedged, {stats['error_rate']:.0%} errors"
+            embed.add_field(name=f"LLM: {provider.name}", value=value, inline=True)
+        if not llm_router.providers:
+            embed.add_field(name="LLM", value="❌ Not Connected", inline=True)
+        embed.add_field(name="Latency", value=f"{round(self.bot.latency * 1000)}ms", inline=True)
+        embed.add_field(name="Task Reminders", value="✅ Active (12 PM Cairo)", inline=True)
+        reminder_stats = self.bot.reminder_stats
+        embed.add_field(
+            name="Scheduled Messages",
+            value=(
+                f"{reminder_stats['delivered']} delivered\n"
+                f"{reminder_stats['api_calls_saved']} API calls / "
+                f"{reminder_stats['db_round_trips_saved']} DB round trips saved"
+            ),
+            inline=True
+        )
+        await ctx.send(embed=embed)
+
+async def setup(bot):
+    await bot.add_cog(General(bot))
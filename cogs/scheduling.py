@@ -0,0 +1,111 @@
+import logging
+import discord
+from discord import app_commands
+from discord.ext import commands
+from datetime import datetime, timedelta, timezone
+from reminder_db import add_reminder, get_all_reminders
+from recurrence import DEFAULT_TZ, TIME_FORMAT, get_zone, next_occurrence, normalize_rule, upcoming
+
+logger = logging.getLogger(__name__)
+SCHEDULED_PREVIEW_COUNT = 3
+
+
+class Scheduling(commands.Cog):
+    """Scheduled (and recurring) channel messages."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="schedule", description="Schedule a message to be sent later (Cairo Time)")
+    @app_commands.describe(
+        message="The message to send",
+        time="When to send it (YYYY-MM-DD HH:MM, 24h Cairo time)",
+        repeat="Optional: daily, weekly, or a cron expression (minute hour day month weekday, Cairo time)"
+    )
+    async def schedule_command(self, interaction: discord.Interaction, message: str, time: str, repeat: str = None):
+        try:
+            await interaction.response.defer(thinking=True)
+            try:
+                # Parse as Cairo time
+                cairo = get_zone(DEFAULT_TZ)
+                when_cairo = datetime.strptime(time, TIME_FORMAT).replace(tzinfo=cairo)
+                when_utc = when_cairo.astimezone(timezone.utc)
+            except Exception:
+                await interaction.followup.send("Invalid time format. Use YYYY-MM-DD HH:MM (24h Cairo time).")
+                return
+            recurrence = None
+            if repeat:
+                try:
+                    recurrence = normalize_rule(repeat, when_cairo)
+                except Exception:
+                    await interaction.followup.send(
+                        "Invalid repeat rule. Use daily, weekly, or a cron expression like `0 9 * * 1-5`."
+                    )
+                    return
+                # The first firing must match the rule, so start from the first occurrence at or after `time`
+                first = next_occurrence(recurrence, when_utc - timedelta(minutes=1), DEFAULT_TZ)
+                if first is None:
+                    await interaction.followup.send("That repeat rule never matches a future time.")
+                    return
+                when_utc = first
+                when_cairo = first.astimezone(cairo)
+            await add_reminder(
+                user_id=interaction.user.id,
+                channel_id=interaction.channel_id,
+                message=message,
+                when_utc=when_utc.strftime(TIME_FORMAT),
+                recurrence=recurrence,
+                tz=DEFAULT_TZ if recurrence else None
+            )
+            repeat_text = f", repeating `{recurrence}`" if recurrence else ""
+            await interaction.followup.send(
+                f"Message scheduled for {when_cairo.strftime(TIME_FORMAT)} Cairo time "
+                f"({when_utc.strftime(TIME_FORMAT)} UTC){repeat_text}!"
+            )
+        except Exception as e:
+            logger.error(f"Error in schedule command: {e}")
+            await interaction.followup.send("Sorry, I couldn't schedule your message.")
+
+    @app_commands.command(name="scheduled", description="Show all scheduled messages (Cairo Time, all users/channels)")
+    async def scheduled_command(self, interaction: discord.Interaction):
+        try:
+            await interaction.response.defer(thinking=True)  # Defer immediately!
+            rows = await get_all_reminders()
+            if not rows:
+                await interaction.followup.send("There are no scheduled messages.")
+                return
+
+            cairo = get_zone(DEFAULT_TZ)
+            lines = []
+            for user_id, channel_id, msg, when_utc, recurrence, tz in rows:
+                when_utc_dt = datetime.strptime(when_utc, TIME_FORMAT).replace(tzinfo=timezone.utc)
+                when_cairo = when_utc_dt.astimezone(cairo).strftime(TIME_FORMAT)
+                line = f"**{when_cairo} Cairo** | <@{user_id}> in <#{channel_id}>: {msg}"
+                if recurrence:
+                    try:
+                        following = upcoming(recurrence, when_utc_dt, tz or DEFAULT_TZ, SCHEDULED_PREVIEW_COUNT)
+                        preview = ", ".join(dt.astimezone(cairo).strftime(TIME_FORMAT) for dt in following)
+                        line += f" _(repeats `{recurrence}`; then {preview})_"
+                    except Exception:
+                        line += f" _(repeats `{recurrence}`)_"
+                lines.append(line)
+
+            output = "\n".join(lines)
+            if len(output) > 2000:
+                with open("scheduled.txt", "w", encoding="utf-8") as f:
+                    f.write(output)
+                file = discord.File("scheduled.txt")
+                await interaction.followup.send("All scheduled messages:", file=file)
+            else:
+                await interaction.followup.send(f"All scheduled messages:\n{output}")
+
+        except Exception as e:
+            logger.error(f"Error in scheduled command: {e}")
+            # Only send a followup if you successfully deferred!
+            try:
+                await interaction.followup.send("Sorry, I couldn't retrieve the scheduled messages.")
+            except Exception:
+                pass  # If the interaction is already expired, just log the error
+
+async def setup(bot):
+    await bot.add_cog(Scheduling(bot))
@@ -0,0 +1,232 @@
+import logging
+import asyncio
+import discord
+from discord import app_commands
+from discord.ext import commands
+from collections import defaultdict
+from task_db import add_task, delete_task, get_all_tasks
+
+logger = logging.getLogger(__name__)
+
+
+class Tasks(commands.Cog):
+    """Task assignment and manual task reminders."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="remind_tasks", description="Manually send task reminders to all users with unfinished tasks")
+    async def remind_tasks_command(self, interaction: discord.Interaction):
+        """Manual command to send task reminders immediately"""
+        try:
+            await interaction.response.defer(thinking=True)
+
+            # Get all tasks
+            tasks = await get_all_tasks()
+            if not tasks:
+                await interaction.followup.send("📋 No tasks found to remind about.")
+                return
+
+            # Group tasks by user
+            user_tasks = defaultdict(list)
+            for task_id, assigner_id, assignee_id, channel_id, task_desc in tasks:
+                user_tasks[assignee_id].append((task_id, assigner_id, channel_id, task_desc))
+
+            reminder_count = 0
+            failed_count = 0
+
+            # Send reminders
+            for assignee_id, task_list in user_tasks.items():
+                try:
+                    # Try to get user
+                    user = interaction.guild.get_member(assignee_id)
+                    if not user:
+                        try:
+                            user = await interaction.guild.fetch_member(assignee_id)
+                        except:
+                            failed_count += 1
+                            continue
+
+                    # Create reminder message
+                    task_lines = []
+                    for task_id, assigner_id, channel_id, task_desc in task_list[:10]:
+                        assigner_name = "Unknown"
+                        try:
+                            assigner = interaction.guild.get_member(assigner_id)
+                            if assigner:
+                                assigner_name = assigner.display_name
+                        except:
+                            pass
+
+                        task_lines.append(f"• **#{task_id}**: {task_desc} _(by {assigner_name})_")
+
+                    if len(task_list) > 10:
+                        task_lines.append(f"• ... and {len(task_list) - 10} more tasks")
+
+                    embed = discord.Embed(
+                        title="📋 Task Reminder (Manual)",
+                        description=f"You have **{len(task_list)}** unfinished task(s):",
+                        color=0xff6600
+                    )
+                    embed.add_field(
+                        name="Your Tasks:",
+                        value="\n".join(task_lines),
+                        inline=False
+                    )
+                    embed.add_field(
+                        name="💡 Tip:",
+                        value="Use `/delete_task <task_id>` to remove completed tasks.",
+                        inline=False
+                    )
+                    embed.set_footer(text=f"Manual reminder sent by {interaction.user.display_name}")
+
+                    # Try to send DM first, then channel message as fallback
+                    try:
+                        await user.send(embed=embed)
+                        reminder_count += 1
+                    except discord.Forbidden:
+                        # Try to send in the current channel
+                        try:
+                            await interaction.channel.send(f"{user.mention}", embed=embed)
+                            reminder_count += 1
+                        except:
+                            failed_count += 1
+
+                    await asyncio.sleep(0.5)  # Rate limit protection
+
+                except Exception as e:
+                    logger.error(f"Error sending manual reminder to user {assignee_id}: {e}")
+                    failed_count += 1
+
+            # Send summary
+            summary_embed = discord.Embed(
+                title="📨 Task Reminders Sent",
+                color=0x00ff00 if failed_count == 0 else 0xff9900
+            )
+            summary_embed.add_field(name="✅ Successfully sent", value=str(reminder_count), inline=True)
+            summary_embed.add_field(name="❌ Failed", value=str(failed_count), inline=True)
+            summary_embed.add_field(name="👥 Total users with tasks", value=str(len(user_tasks)), inline=True)
+
+            await interaction.followup.send(embed=summary_embed)
+
+        except Exception as e:
+            logger.error(f"Error in remind_tasks command: {e}")
+            await interaction.followup.send("❌ Sorry, I couldn't send the task reminders. Please try again.")
+
+    @app_commands.command(name="assign", description="Assign a task to a user")
+    @app_commands.describe(
+        user="The user to assign the task to",
+        task="The task description"
+    )
+    async def assign_command(self, interaction: discord.Interaction, user: discord.Member, task: str):
+        try:
+            await add_task(
+                assigner_id=interaction.user.id,
+                assignee_id=user.id,
+                channel_id=interaction.channel_id,
+                task=task
+            )
+            await interaction.response.send_message(
+                f"✅ Task assigned to {user.mention}: {task}", ephemeral=False
+            )
+        except Exception as e:
+            logger.error(f"Error in assign command: {e}")
+            await interaction.response.send_message("Sorry, I couldn't assign the task.")
+
+    @app_commands.command(name="delete_task", description="Delete a task by its ID")
+    @app_commands.describe(
+        task_id="The ID of the task to delete"
+    )
+    async def delete_task_command(self, interaction: discord.Interaction, task_id: int):
+        try:
+            await delete_task(task_id)
+            await interaction.response.send_message(f"🗑️ Task {task_id} deleted.", ephemeral=False)
+        except Exception as e:
+            logger.error(f"Error in delete_task command: {e}")
+            await interaction.response.send_message("Sorry, I couldn't delete the task.")
+    @app_commands.command(name="tasks", description="View all assigned tasks")
+    async def tasks_command(self, interaction: discord.Interaction):
+        try:
+            await interaction.response.defer(thinking=True)
+            tasks = await get_all_tasks()
+            if not tasks:
+                await interaction.followup.send("No tasks assigned yet.")
+                return
+
+            from collections import defaultdict
+            user_tasks = defaultdict(list)
+            for task_id, assigner_id, assignee_id, channel_id, task_desc in tasks:
+                user_tasks[assignee_id].append((task_id, assigner_id, channel_id, task_desc))
+
+            embeds = []
+            for assignee_id, task_list in user_tasks.items():
+                # Try to get the member from cache, else fetch from API
+                user = interaction.guild.get_member(assignee_id)
+                if user is None:
+                    try:
+                        user = await interaction.guild.fetch_member(assignee_id)
+                    except Exception:
+                        user = None
+
+                if user:
+                    name = user.display_name
+                    icon_url = user.display_avatar.url
+                else:
+                    name = f"User {assignee_id}"
+                    icon_url = None
+
+                value = ""
+                for task_id, assigner_id, channel_id, task_desc in task_list:
+                    line = f"**#{task_id}**: {task_desc} _(by <@{assigner_id}> in <#{channel_id}>)_\n"
+                    if len(value) + len(line) > 1024:
+                        value += "... (truncated)\n"
+                        break
+                    value += line
+
+                embed = discord.Embed(
+                    title=f"📋 Tasks for {name}",
+                    description=value or "No tasks.",
+                    color=0x3498db
+                )
+                if icon_url:
+                    embed.set_author(name=name, icon_url=icon_url)
+                else:
+                    embed.set_author(name=name)
+                embed.set_footer(text="Task IDs shown for easy reference.")
+                embeds.append(embed)
+
+            for i in range(0, len(embeds), 10):
+                await interaction.followup.send(embeds=embeds[i:i+10])
+
+        except Exception as e:
+            logger.error(f"Error in tasks command: {e}")
+            await interaction.followup.send("Sorry, I couldn't retrieve the tasks.")
+
+    @app_commands.command(name="assign_all", description="Assign a task to all users in the server")
+    @app_commands.describe(
+        task="The task description"
+    )
+    async def assign_all_command(self, interaction: discord.Interaction, task: str):
+        try:
+            await interaction.response.defer(thinking=True)
+            members = [m for m in interaction.guild.members if not m.bot]
+            if not members:
+                await interaction.followup.send("No users found to assign the task.")
+                return
+
+            for member in members:
+                await add_task(
+                    assigner_id=interaction.user.id,
+                    assignee_id=member.id,
+                    channel_id=interaction.channel_id,
+                    task=task
+                )
+            await interaction.followup.send(
+                f"✅ Task assigned to **{len(members)}** users: {task}"
+            )
+        except Exception as e:
+            logger.error(f"Error in assign_all command: {e}")
+            await interaction.followup.send("Sorry, I couldn't assign the task to all users.")
+
+async def setup(bot):
+    await bot.add_cog(Tasks(bot))
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+from collections import Counter, defaultdict
+from time import perf_counter
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_INTERVAL = 0.005
+LAG_CHECK_INTERVAL = 0.5
+DEFAULT_LAG_THRESHOLD = 0.25
+
+# Overlapping runs would restore each other's saved debug settings and could leave debug mode on
+_profile_lock = asyncio.Lock()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Samples one thread's stack from a helper thread and counts collapsed stacks.
+
+    The output of `folded()` is the collapsed format flamegraph.pl and speedscope read:
+    one `root;child;leaf count` line per distinct stack.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+                self.samples += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="bor3y-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+    def top_functions(self, n: int):
+        """Return [(label, samples)] for the functions most often on top of the stack."""
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(n)
+
+
+class SlowCallbackCollector(logging.Handler):
+    """Collects the 'Executing <Handle> took N seconds' warnings asyncio debug mode emits."""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.callbacks = defaultdict(list)
+
+    def emit(self, record):
+        if isinstance(record.msg, str) and record.msg.startswith("Executing ") and len(record.args or ()) == 2:
+            handle, duration = record.args
+            self.callbacks[str(handle)].append(duration)
+
+    def top(self, n: int):
+        """Return [(handle, count, total, worst)] sorted by total blocking time."""
+        rows = [(handle, len(d), sum(d), max(d)) for handle, d in self.callbacks.items()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:n]
+
+
+def is_profiling() -> bool:
+    return _profile_lock.locked()
+
+
+async def profile_loop(seconds: float, slow_threshold: float):
+    """Profile the running event loop for `seconds`; returns (profiler, slow callback collector).
+
+    Raises RuntimeError if another profile is already running.
+    """
+    if _profile_lock.locked():
+        raise RuntimeError("A profile is already running")
+    async with _profile_lock:
+        return await _profile_loop(seconds, slow_threshold)
+
+
+async def _profile_loop(seconds: float, slow_threshold: float):
+    loop = asyncio.get_running_loop()
+    profiler = SamplingProfiler(threading.get_ident())
+    collector = SlowCallbackCollector()
+    asyncio_logger = logging.getLogger("asyncio")
+
+    previous_debug = loop.get_debug()
+    previous_threshold = loop.slow_callback_duration
+    asyncio_logger.addHandler(collector)
+    loop.slow_callback_duration = slow_threshold
+    loop.set_debug(True)
+    profiler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop()
+        loop.set_debug(previous_debug)
+        loop.slow_callback_duration = previous_threshold
+        asyncio_logger.removeHandler(collector)
+    return profiler, collector
+
+
+def format_report(profiler: SamplingProfiler, collector: SlowCallbackCollector, seconds: float,
+                  slow_threshold: float, top_n: int) -> str:
+    lines = [f"Profiled {seconds:.0f}s, {profiler.samples} samples, slow callback threshold {slow_threshold * 1000:.0f}ms", ""]
+    lines.append(f"Top {top_n} blocking callbacks (by total time):")
+    slow = collector.top(top_n)
+    if not slow:
+        lines.append("  none")
+    for handle, count, total, worst in slow:
+        lines.append(f"  {total * 1000:8.0f}ms total  {count:4d}x  worst {worst * 1000:6.0f}ms  {handle}")
+    lines.append("")
+    lines.append(f"Top {top_n} functions on the loop thread (by samples):")
+    for label, count in profiler.top_functions(top_n):
+        share = count / profiler.samples if profiler.samples else 0
+        lines.append(f"  {count:6d}  {share:6.1%}  {label}")
+    return "\n".join(lines)
+
+
+class LoopLagMonitor:
+    """Always-on watchdog: sleeps a fixed interval and logs when wakeups come late."""
+
+    def __init__(self, threshold: float = DEFAULT_LAG_THRESHOLD, interval: float = LAG_CHECK_INTERVAL):
+        self.threshold = threshold
+        self.interval = interval
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.lag_events = 0
+
+    async def run(self):
+        while True:
+            start = perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = perf_counter() - start - self.interval
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            if lag > self.threshold:
+                self.lag_events += 1
+                logger.warning(f"Event loop lag {lag * 1000:.0f}ms exceeded {self.threshold * 1000:.0f}ms")
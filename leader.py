@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+import aiosqlite
+
+import reminder_db
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "scheduler"
+LEASE_TTL = 15.0
+HEARTBEAT_INTERVAL = 5.0
+
+
+async def init_lease_db(db_path=None):
+    async with aiosqlite.connect(db_path or reminder_db.DB_PATH) as db:
+        # WAL lets replicas read while the leader writes
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS leases (
+                name TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                token INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS job_runs (
+                job TEXT NOT NULL,
+                run_key TEXT NOT NULL,
+                token INTEGER NOT NULL,
+                PRIMARY KEY (job, run_key)
+            )
+        """)
+        await db.commit()
+
+
+class LeaderElector:
+    """Lease-based leader election over the shared SQLite database.
+
+    The holder renews its lease every heartbeat. When a different process takes
+    over an expired lease the token is bumped, so every write made under the
+    lease can be fenced with `token` and a stale leader's writes are rejected.
+    """
+
+    def __init__(self, name: str = LEASE_NAME, ttl: float = LEASE_TTL,
+                 heartbeat: float = HEARTBEAT_INTERVAL, db_path: str = None):
+        self.name = name
+        self.ttl = ttl
+        self.heartbeat = heartbeat
+        self.db_path = db_path
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.token = None
+        self.expires_at = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        # Step down locally before the lease runs out rather than trusting a late renewal
+        return self.token is not None and time.time() < self.expires_at - self.heartbeat / 2
+
+    async def try_acquire(self) -> bool:
+        now = time.time()
+        expires_at = now + self.ttl
+        async with aiosqlite.connect(self.db_path or reminder_db.DB_PATH) as db:
+            await db.execute("""
+                INSERT INTO leases (name, holder, token, expires_at) VALUES (?, ?, 1, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    token = CASE WHEN leases.holder = excluded.holder THEN leases.token ELSE leases.token + 1 END,
+                    holder = excluded.holder,
+                    expires_at = excluded.expires_at
+                WHERE leases.holder = excluded.holder OR leases.expires_at < ?
+            """, (self.name, self.holder, expires_at, now))
+            await db.commit()
+            cursor = await db.execute("SELECT holder, token FROM leases WHERE name = ?", (self.name,))
+            holder, token = await cursor.fetchone()
+
+        was_leader = self.is_leader
+        if holder == self.holder:
+            self.token = token
+            self.expires_at = expires_at
+            if not was_leader:
+                logger.info(f"Acquired {self.name} lease as {self.holder} (token {token})")
+            return True
+        if self.token is not None:
+            logger.warning(f"Lost {self.name} lease to {holder} (token {token})")
+        self.token = None
+        self.expires_at = 0.0
+        return False
+
+    async def release(self):
+        if self.token is None:
+            return
+        async with aiosqlite.connect(self.db_path or reminder_db.DB_PATH) as db:
+            await db.execute(
+                "UPDATE leases SET expires_at = 0 WHERE name = ? AND holder = ? AND token = ?",
+                (self.name, self.holder, self.token)
+            )
+            await db.commit()
+        logger.info(f"Released {self.name} lease (token {self.token})")
+        self.token = None
+        self.expires_at = 0.0
+
+    async def run(self):
+        try:
+            while True:
+                try:
+                    await self.try_acquire()
+                except Exception as e:
+                    logger.error(f"Lease heartbeat failed: {e}")
+                await asyncio.sleep(self.heartbeat)
+        finally:
+            # Hand the lease over immediately instead of making standbys wait out the TTL
+            try:
+                await asyncio.shield(self.release())
+            except Exception as e:
+                logger.error(f"Failed to release lease: {e}")
+
+    async def wait_for_leadership(self):
+        while not self.is_leader:
+            await asyncio.sleep(self.heartbeat / 2)
+
+    async def claim_run(self, job: str, run_key: str) -> bool:
+        """Atomically claim a one-off run (e.g. one day's digest); only one replica ever wins."""
+        if not self.is_leader:
+            return False
+        async with aiosqlite.connect(self.db_path or reminder_db.DB_PATH) as db:
+            cursor = await db.execute("""
+                INSERT OR IGNORE INTO job_runs (job, run_key, token)
+                SELECT ?, ?, token FROM leases
+                WHERE name = ? AND holder = ? AND token = ? AND expires_at > ?
+            """, (job, run_key, self.name, self.holder, self.token, time.time()))
+            await db.commit()
+            return cursor.rowcount == 1
+
+
+async def _demo(db_path: str, seconds: float):
+    """Run one replica against `db_path`; start several to watch failover."""
+    await init_lease_db(db_path)
+    elector = LeaderElector(ttl=3.0, heartbeat=1.0, db_path=db_path)
+    task = asyncio.create_task(elector.run())
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        print(f"{elector.holder} leader={elector.is_leader} token={elector.token}", flush=True)
+        await asyncio.sleep(1)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    import sys
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    path = sys.argv[1] if len(sys.argv) > 1 else "leader_demo.db"
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(_demo(path, duration))
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, perf_counter
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW = 100
+MIN_SAMPLES = 10
+DEFAULT_DEADLINE = 4.0
+MIN_DEADLINE = 0.5
+FAILURE_THRESHOLD = 3
+COOLDOWN_SECONDS = 30.0
+LLM_WORKERS = 4
+
+# Blocking providers run here rather than in the default executor, so abandoned hedge losers
+# can't starve /summarize, /search and /ask_pdf of worker threads
+_executor = ThreadPoolExecutor(max_workers=LLM_WORKERS, thread_name_prefix="bor3y-llm")
+
+
+def _response_text(response) -> str:
+    if hasattr(response, "content"):
+        return response.content.strip()
+    return str(response).strip()
+
+
+class Provider:
+    """A named LLM backend.
+
+    `llm` is anything with a blocking `invoke(prompt)`; if it also has `ainvoke(prompt)`
+    (as LangChain chat models do) that is used instead, so cancelling a hedge loser
+    aborts its HTTP request.
+    """
+
+    def __init__(self, name: str, llm):
+        self.name = name
+        self.llm = llm
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.outcomes = deque(maxlen=LATENCY_WINDOW)  # True for success
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.requests = 0
+        self.hedged = 0
+
+    @property
+    def is_async(self) -> bool:
+        return callable(getattr(self.llm, "ainvoke", None))
+
+    def invoke(self, prompt):
+        return _response_text(self.llm.invoke(prompt))
+
+    async def ainvoke(self, prompt):
+        return _response_text(await self.llm.ainvoke(prompt))
+
+    def percentile(self, pct: float):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    def is_available(self, now: float) -> bool:
+        # Once the cooldown passes the breaker is half-open: one more failure reopens it
+        return now >= self.open_until
+
+    def record_success(self, latency: float):
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self, now: float):
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= FAILURE_THRESHOLD:
+            self.open_until = now + COOLDOWN_SECONDS
+            logger.warning(f"Circuit opened for {self.name} after {self.consecutive_failures} failures")
+
+    def score(self) -> float:
+        """Lower is better: typical latency inflated by the recent error rate."""
+        median = self.percentile(0.5)
+        if median is None:
+            median = DEFAULT_DEADLINE / 2
+        return median / max(0.05, 1 - self.error_rate)
+
+    def stats(self) -> dict:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "p50": p50,
+            "p95": p95,
+            "error_rate": self.error_rate,
+            "circuit_open": not self.is_available(monotonic()),
+        }
+
+
+class LLMRouter:
+    """Routes prompts across providers with p95-based hedging and per-provider circuit breakers."""
+
+    def __init__(self, providers):
+        self.providers = list(providers)
+
+    def ranked(self):
+        now = monotonic()
+        available = [p for p in self.providers if p.is_available(now)]
+        return sorted(available, key=lambda p: p.score())
+
+    def deadline_for(self, provider: Provider) -> float:
+        if len(provider.latencies) < MIN_SAMPLES:
+            return DEFAULT_DEADLINE
+        return max(MIN_DEADLINE, provider.percentile(0.95))
+
+    async def _call(self, provider: Provider, prompt):
+        provider.requests += 1
+        if not provider.is_async:
+            return await self._call_in_thread(provider, prompt)
+        start = perf_counter()
+        try:
+            result = await provider.ainvoke(prompt)
+        except asyncio.CancelledError:
+            # Lost a hedge race and the request was aborted. The elapsed time is only a lower bound
+            # on its latency, so it may raise the estimate (when already above p95) but never lower it.
+            elapsed = perf_counter() - start
+            p95 = provider.percentile(0.95)
+            if p95 is not None and elapsed > p95:
+                provider.latencies.append(elapsed)
+            raise
+        except Exception as e:
+            provider.record_failure(monotonic())
+            logger.error(f"LLM provider {provider.name} failed: {e}")
+            raise
+        provider.record_success(perf_counter() - start)
+        return result
+
+    async def _call_in_thread(self, provider: Provider, prompt):
+        """Run a blocking provider on the LLM pool.
+
+        A thread can't be interrupted, so a cancelled (hedged-away) call keeps running; its real
+        outcome and latency are still recorded when it finishes.
+        """
+        loop = asyncio.get_running_loop()
+        start = perf_counter()
+        future = _executor.submit(provider.invoke, prompt)
+
+        def settle(done):
+            latency = perf_counter() - start
+            try:
+                loop.call_soon_threadsafe(self._record_outcome, provider, done, latency)
+            except RuntimeError:
+                pass  # the loop has closed; nothing left to update
+
+        # Added before wrap_future's own callback, so stats are updated before the caller resumes
+        future.add_done_callback(settle)
+        return await asyncio.wrap_future(future)
+
+    def _record_outcome(self, provider: Provider, future, latency: float):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            provider.record_success(latency)
+        else:
+            provider.record_failure(monotonic())
+            logger.error(f"LLM provider {provider.name} failed: {error}")
+
+    async def invoke(self, prompt):
+        """Return the first successful response, or None if every provider failed."""
+        ranked = self.ranked()
+        if not ranked:
+            logger.error("No LLM providers available")
+            return None
+
+        pending = {}
+        waiting = list(ranked)
+        primary = waiting.pop(0)
+        pending[asyncio.ensure_future(self._call(primary, prompt))] = primary
+        timeout = self.deadline_for(primary)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider = pending.pop(task)
+                    if not task.exception():
+                        logger.info(f"LLM response served by {provider.name}")
+                        return task.result()
+                if not waiting:
+                    timeout = None
+                    continue
+                # Either the deadline passed (hedge) or a provider failed (fall back)
+                backup = waiting.pop(0)
+                if not done:
+                    backup.hedged += 1
+                    logger.info(f"Hedging {primary.name} request to {backup.name} after {timeout:.2f}s")
+                pending[asyncio.ensure_future(self._call(backup, prompt))] = backup
+                timeout = self.deadline_for(backup)
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from summarizer import get_groq_llm
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = "pdf_index"
+MANIFEST_PATH = os.path.join(INDEX_DIR, "manifest.json")
+EMBED_BATCH_SIZE = 64
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 150
+DEFAULT_TOP_K = 4
+DOC_ID_LENGTH = 12
+
+ASK_PROMPT = (
+    "Answer the question using only the excerpts from the document below. "
+    "If the excerpts don't contain the answer, say so.\n\n"
+    "Excerpts:\n{context}\n\n"
+    "Question: {question}"
+)
+
+_embeddings = None
+_matrices = {}
+
+
+def get_embeddings():
+    global _embeddings
+    if _embeddings is None:
+        _embeddings = GoogleGenerativeAIEmbeddings(
+            model="models/embedding-001",
+            google_api_key=os.environ.get("GEMINI_API_KEY"),
+        )
+    return _embeddings
+
+
+def hash_file(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _paths(doc_hash: str):
+    base = os.path.join(INDEX_DIR, doc_hash)
+    return base + ".npy", base + ".json"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def is_indexed(doc_hash: str) -> bool:
+    return all(os.path.exists(p) for p in _paths(doc_hash))
+
+
+def index_document(doc_hash: str, docs, filename: str) -> int:
+    """Embed the document's chunks in batches and store them on disk. Returns the chunk count."""
+    if is_indexed(doc_hash):
+        return len(_load_chunks(doc_hash))
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    chunks = [doc.page_content for doc in splitter.split_documents(docs) if doc.page_content.strip()]
+    if not chunks:
+        return 0
+
+    embeddings = get_embeddings()
+    vectors = []
+    for i in range(0, len(chunks), EMBED_BATCH_SIZE):
+        vectors.extend(embeddings.embed_documents(chunks[i:i + EMBED_BATCH_SIZE]))
+    matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    matrix_path, chunks_path = _paths(doc_hash)
+    # Write the metadata last so a half-written index is never seen as complete
+    np.save(matrix_path, matrix)
+    with open(chunks_path, "w", encoding="utf-8") as f:
+        json.dump({"filename": filename, "chunks": chunks}, f, ensure_ascii=False)
+    logger.info(f"Indexed {filename} ({len(chunks)} chunks) as {document_id(doc_hash)}")
+    return len(chunks)
+
+
+def _load_matrix(doc_hash: str) -> np.ndarray:
+    matrix = _matrices.get(doc_hash)
+    if matrix is None:
+        matrix = np.load(_paths(doc_hash)[0], mmap_mode="r")
+        _matrices[doc_hash] = matrix
+    return matrix
+
+
+def _load_chunks(doc_hash: str) -> list:
+    with open(_paths(doc_hash)[1], encoding="utf-8") as f:
+        return json.load(f)["chunks"]
+
+
+def search(doc_hash: str, query: str, k: int = DEFAULT_TOP_K) -> list:
+    """Return the top-k (score, chunk) pairs by cosine similarity."""
+    matrix = _load_matrix(doc_hash)
+    query_vector = _normalize(np.asarray(get_embeddings().embed_query(query), dtype=np.float32))
+    scores = matrix @ query_vector
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    chunks = _load_chunks(doc_hash)
+    return [(float(scores[i]), chunks[i]) for i in top]
+
+
+def answer_question(doc_hash: str, question: str, k: int = DEFAULT_TOP_K) -> str:
+    results = search(doc_hash, question, k)
+    context = "\n\n---\n\n".join(chunk for _, chunk in results)
+    response = get_groq_llm().invoke(ASK_PROMPT.format(context=context, question=question))
+    return response.content.strip() if hasattr(response, "content") else str(response).strip()
+
+
+def document_id(doc_hash: str) -> str:
+    """The short ID /summarize shows users."""
+    return doc_hash[:DOC_ID_LENGTH]
+
+
+def _scope_key(guild_id, channel_id) -> str:
+    # Documents are shared within a server; DMs are scoped to the DM channel
+    return f"guild:{guild_id}" if guild_id is not None else f"channel:{channel_id}"
+
+
+def resolve_document(document: str, guild_id, channel_id):
+    """Find a document indexed in the caller's server (or DM) by its ID or full hash.
+
+    The ID must be at least DOC_ID_LENGTH hex characters and match exactly one document.
+    """
+    document = (document or "").strip().lower()
+    if len(document) < DOC_ID_LENGTH or any(c not in "0123456789abcdef" for c in document):
+        return None
+    scoped = _read_manifest()["scopes"].get(_scope_key(guild_id, channel_id), [])
+    matches = [doc_hash for doc_hash in scoped if doc_hash.startswith(document)]
+    if len(matches) != 1 or not is_indexed(matches[0]):
+        return None
+    return matches[0]
+
+
+def _read_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = {}
+    manifest.setdefault("channels", {})
+    manifest.setdefault("scopes", {})
+    return manifest
+
+
+def set_channel_document(guild_id, channel_id: int, doc_hash: str):
+    """Make `doc_hash` the channel's default document and visible to the rest of its server."""
+    manifest = _read_manifest()
+    manifest["channels"][str(channel_id)] = doc_hash
+    scoped = manifest["scopes"].setdefault(_scope_key(guild_id, channel_id), [])
+    if doc_hash not in scoped:
+        scoped.append(doc_hash)
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+
+def get_channel_document(channel_id: int):
+    doc_hash = _read_manifest()["channels"].get(str(channel_id))
+    return doc_hash if doc_hash and is_indexed(doc_hash) else None
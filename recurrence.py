@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone, time
+from functools import lru_cache
+from itertools import islice
+from zoneinfo import ZoneInfo
+
+DEFAULT_TZ = "Africa/Cairo"
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Long enough to reach the next Feb 29 even across a skipped leap year.
+_MAX_LOOKAHEAD_DAYS = 366 * 8
+_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str) -> ZoneInfo:
+    """Return a shared ZoneInfo so hot loops don't rebuild one per row."""
+    return ZoneInfo(name)
+
+
+def _parse_field(field: str, low: int, high: int) -> frozenset:
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Invalid step in cron field: {field}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step != 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron field out of range ({low}-{high}): {field}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronRule:
+    """A five-field cron expression: minute hour day-of-month month day-of-week."""
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError("Cron expression needs 5 fields: minute hour day month weekday")
+        parsed = [_parse_field(f, low, high) for f, (low, high) in zip(fields, _FIELD_RANGES)]
+        self.expression = " ".join(fields)
+        self.minutes = sorted(parsed[0])
+        self.hours = sorted(parsed[1])
+        self.days = parsed[2]
+        self.months = parsed[3]
+        # Cron allows both 0 and 7 for Sunday
+        self.weekdays = frozenset(d % 7 for d in parsed[4])
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    def _day_matches(self, day) -> bool:
+        if day.month not in self.months:
+            return False
+        day_ok = day.day in self.days
+        weekday_ok = (day.weekday() + 1) % 7 in self.weekdays
+        if self.any_day and self.any_weekday:
+            return True
+        if self.any_day:
+            return weekday_ok
+        if self.any_weekday:
+            return day_ok
+        # Standard cron: when both are restricted, either one matching is enough
+        return day_ok or weekday_ok
+
+    def next_after(self, after: datetime, zone: ZoneInfo):
+        """Return the first occurrence strictly after `after` as an aware UTC datetime."""
+        local = after.astimezone(zone).replace(tzinfo=None, second=0, microsecond=0)
+        for offset in range(_MAX_LOOKAHEAD_DAYS):
+            day = local.date() + timedelta(days=offset)
+            if not self._day_matches(day):
+                continue
+            for hour in self.hours:
+                for minute in self.minutes:
+                    candidate = datetime.combine(day, time(hour, minute))
+                    if candidate <= local:
+                        continue
+                    when_utc = candidate.replace(tzinfo=zone).astimezone(timezone.utc)
+                    if when_utc > after:
+                        return when_utc
+        return None
+
+
+@lru_cache(maxsize=256)
+def get_rule(expression: str) -> CronRule:
+    return CronRule(expression)
+
+
+def normalize_rule(repeat: str, first_local: datetime) -> str:
+    """Turn 'daily'/'weekly' into a cron expression anchored at the first occurrence."""
+    repeat = repeat.strip().lower()
+    if repeat == "daily":
+        return f"{first_local.minute} {first_local.hour} * * *"
+    if repeat == "weekly":
+        weekday = (first_local.weekday() + 1) % 7
+        return f"{first_local.minute} {first_local.hour} * * {weekday}"
+    return get_rule(repeat).expression
+
+
+def next_occurrence(expression: str, after: datetime, tz_name: str = DEFAULT_TZ):
+    return get_rule(expression).next_after(after, get_zone(tz_name))
+
+
+def iter_occurrences(expression: str, after: datetime, tz_name: str = DEFAULT_TZ):
+    """Lazily yield occurrences after `after`; nothing is materialized up front."""
+    rule = get_rule(expression)
+    zone = get_zone(tz_name)
+    current = rule.next_after(after, zone)
+    while current is not None:
+        yield current
+        current = rule.next_after(current, zone)
+
+
+def upcoming(expression: str, after: datetime, tz_name: str = DEFAULT_TZ, count: int = 3):
+    return list(islice(iter_occurrences(expression, after, tz_name), count))
@@ -1,5 +1,10 @@
+import logging
+import time
 import aiosqlite
 from datetime import datetime, timezone
+from recurrence import DEFAULT_TZ, TIME_FORMAT, next_occurrence
+
+logger = logging.getLogger(__name__)
 
 DB_PATH = "reminders.db"
 
@@ -11,29 +16,84 @@ async def init_db():
                 user_id INTEGER NOT NULL,
                 channel_id INTEGER NOT NULL,
                 message TEXT NOT NULL,
-                when_utc TEXT NOT NULL
+                when_utc TEXT NOT NULL,
+                recurrence TEXT,
+                tz TEXT
             )
         """)
+        # Older databases were created before recurring reminders existed
+        cursor = await db.execute("PRAGMA table_info(reminders)")
+        columns = {row[1] for row in await cursor.fetchall()}
+        if "recurrence" not in columns:
+            await db.execute("ALTER TABLE reminders ADD COLUMN recurrence TEXT")
+        if "tz" not in columns:
+            await db.execute("ALTER TABLE reminders ADD COLUMN tz TEXT")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_reminders_when ON reminders (when_utc)")
         await db.commit()
 
-async def add_reminder(user_id, channel_id, message, when_utc):
+async def add_reminder(user_id, channel_id, message, when_utc, recurrence=None, tz=None):
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute(
-            "INSERT INTO reminders (user_id, channel_id, message, when_utc) VALUES (?, ?, ?, ?)",
-            (user_id, channel_id, message, when_utc)
+            "INSERT INTO reminders (user_id, channel_id, message, when_utc, recurrence, tz) VALUES (?, ?, ?, ?, ?, ?)",
+            (user_id, channel_id, message, when_utc, recurrence, tz)
         )
         await db.commit()
 
-async def get_due_reminders(now_utc):
+async def claim_due_reminders(now_dt, lease_name, holder, token):
+    """Claim and settle due reminders in one transaction under the scheduler lease.
+
+    One-shot reminders are deleted and recurring ones advanced past `now_dt` before
+    the rows are returned for sending, so a later retry or a new leader can never
+    pick them up again (at-most-once delivery). Nothing is claimed unless `holder`
+    still owns the lease with fencing token `token`.
+    """
+    now_utc = now_dt.strftime(TIME_FORMAT)
+    async with aiosqlite.connect(DB_PATH) as db:
+        # Take the write lock up front so the lease check and the settle see the same state
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = await db.execute(
+                "SELECT 1 FROM leases WHERE name = ? AND holder = ? AND token = ? AND expires_at > ?",
+                (lease_name, holder, token, time.time())
+            )
+            if await cursor.fetchone() is None:
+                await db.rollback()
+                return []
+            cursor = await db.execute(
+                "SELECT id, user_id, channel_id, message, when_utc, recurrence, tz FROM reminders WHERE when_utc <= ?",
+                (now_utc,)
+            )
+            due = await cursor.fetchall()
+
+            delete_ids = []
+            reschedules = []
+            for _id, user_id, channel_id, message, when_utc, recurrence, tz in due:
+                if recurrence:
+                    # Advance past now so occurrences missed while offline don't fire in a burst
+                    try:
+                        next_when = next_occurrence(recurrence, now_dt, tz or DEFAULT_TZ)
+                    except Exception as e:
+                        logger.error(f"Invalid recurrence for reminder {_id}: {e}")
+                        next_when = None
+                    if next_when:
+                        reschedules.append((next_when.strftime(TIME_FORMAT), _id))
+                        continue
+                delete_ids.append(_id)
+
+            if reschedules:
+                await db.executemany("UPDATE reminders SET when_utc = ? WHERE id = ?", reschedules)
+            if delete_ids:
+                placeholders = ", ".join("?" * len(delete_ids))
+                await db.execute(f"DELETE FROM reminders WHERE id IN ({placeholders})", delete_ids)
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+        return due
+
+async def get_all_reminders():
     async with aiosqlite.connect(DB_PATH) as db:
         cursor = await db.execute(
-            "SELECT id, user_id, channel_id, message, when_utc FROM reminders WHERE when_utc <= ?",
-            (now_utc,)
+            "SELECT user_id, channel_id, message, when_utc, recurrence, tz FROM reminders ORDER BY when_utc"
         )
         return await cursor.fetchall()
-
-async def delete_reminder(reminder_id):
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
-        await db.commit()
-
@@ -0,0 +1,71 @@
+import os
+import re
+
+_MENTION_PATTERN = re.compile(r"<@!?\d+>")
+
+
+# Plain int bit flags: enum.IntFlag arithmetic is too slow for the per-message path
+ROUTE_IGNORE = 0
+ROUTE_COMMAND = 1
+ROUTE_MENTION = 2
+
+
+def parse_allowlist(raw: str) -> dict:
+    """Parse 'guild:chan,chan;guild:chan' into {guild_id: frozenset(channel_ids)}."""
+    allowlist = {}
+    for entry in (raw or "").split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        guild_text, _, channels_text = entry.partition(":")
+        channels = {int(c) for c in channels_text.split(",") if c.strip()}
+        allowlist[int(guild_text)] = allowlist.get(int(guild_text), frozenset()) | channels
+    return allowlist
+
+
+def strip_mentions(content: str) -> str:
+    """Remove every user mention in a single pass."""
+    return _MENTION_PATTERN.sub("", content).strip()
+
+
+class MessageRouter:
+    """Decides cheaply whether a gateway message is meant for the bot at all.
+
+    Everything here is a set lookup or a prefix/substring check on the raw
+    content, so irrelevant chatter is dropped before discord.py parses it
+    as a command.
+    """
+
+    def __init__(self, prefix: str = "!", allowlist: dict = None):
+        self.prefix = prefix
+        self.allowlist = allowlist or {}
+        self.bot_id = None
+        self._mention_tokens = ()
+
+    @classmethod
+    def from_env(cls, prefix: str = "!"):
+        return cls(prefix, parse_allowlist(os.environ.get("CHANNEL_ALLOWLIST", "")))
+
+    def set_bot_user(self, bot_id: int):
+        self.bot_id = bot_id
+        self._mention_tokens = (f"<@{bot_id}>", f"<@!{bot_id}>")
+
+    def route(self, message) -> int:
+        author = message.author
+        if author.id == self.bot_id:
+            return ROUTE_IGNORE
+        guild = message.guild
+        if guild is not None:
+            allowed = self.allowlist.get(guild.id)
+            if allowed is not None and message.channel.id not in allowed:
+                return ROUTE_IGNORE
+        content = message.content
+        route = ROUTE_IGNORE
+        if content.startswith(self.prefix):
+            route |= ROUTE_COMMAND
+        if self._mention_tokens and (self._mention_tokens[0] in content or self._mention_tokens[1] in content):
+            route |= ROUTE_MENTION
+        elif message.reference is not None and any(m.id == self.bot_id for m in message.mentions):
+            # Replies ping the bot without putting a mention token in the content
+            route |= ROUTE_MENTION
+        return route
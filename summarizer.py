@@ -6,14 +6,21 @@ import os
 from dotenv import load_dotenv
 
 load_dotenv()
-def run_summarizer(file_path: str) -> str:
-    loader = PyPDFLoader(file_path)
-    docs = loader.load_and_split()
-    llm = ChatGroq(
+def get_groq_llm(temperature: float = 0.2):
+    return ChatGroq(
         model="llama3-70b-8192",
         api_key=os.getenv("GROQ_API_KEY"),
-        temperature=0.2,
+        temperature=temperature,
     )
+
+def load_pdf(file_path: str):
+    loader = PyPDFLoader(file_path)
+    return loader.load_and_split()
+
+def run_summarizer(file_path: str, docs=None) -> str:
+    if docs is None:
+        docs = load_pdf(file_path)
+    llm = get_groq_llm()
     chain = load_summarize_chain(llm, chain_type="map_reduce")
     result = chain.invoke(docs)
     return result["output_text"]
\ No newline at end of file